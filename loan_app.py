@@ -1,6 +1,9 @@
 import streamlit as st
+import numpy as np
 import pandas as pd
 
+from translations import LANGUAGES, translate
+
 def calculate_loan(principal, taeg, duration_months, insurance_amount):
     """Calculates loan details based on principal, TAEG, duration, and insurance.
 
@@ -17,13 +20,18 @@ def calculate_loan(principal, taeg, duration_months, insurance_amount):
             - total_paid (float): The total amount paid over the loan duration.
             - cost_percentage (float): The cost as a percentage of the loan.
             - insurance_total_cost: The total insurance cost.
-            - amortization_table (DataFrame): The amortization table.
+            - amortization_schedule (dict): The numeric amortization schedule, turned
+              into a localized table by create_amortization_table when displayed.
     """
     if principal <= 0 or taeg <= 0 or duration_months <= 0:
         raise ValueError(get_translation("Les valeurs doivent être positives."))
 
     monthly_rate = taeg / 100 / 12
-    monthly_payment_without_insurance = principal * (monthly_rate * (1 + monthly_rate) ** duration_months) / ((1 + monthly_rate) ** duration_months - 1)
+    if monthly_rate == 0:
+        monthly_payment_without_insurance = principal / duration_months
+    else:
+        growth = (1 + monthly_rate) ** duration_months
+        monthly_payment_without_insurance = principal * monthly_rate * growth / (growth - 1)
     monthly_payment_with_insurance = monthly_payment_without_insurance + insurance_amount
 
     total_paid = monthly_payment_with_insurance * duration_months
@@ -31,8 +39,8 @@ def calculate_loan(principal, taeg, duration_months, insurance_amount):
     cost_percentage = (total_cost / principal) * 100
     insurance_total_cost = insurance_amount * duration_months
 
-    # Amortization table
-    amortization_table = create_amortization_table(principal, monthly_rate, monthly_payment_without_insurance, duration_months, insurance_amount)
+    # Amortization schedule (numeric only, so it stays valid when the language changes)
+    amortization_schedule = compute_amortization_schedule(principal, monthly_rate, monthly_payment_without_insurance, duration_months, insurance_amount)
 
     return {
         "monthly_payment": monthly_payment_with_insurance,
@@ -40,48 +48,100 @@ def calculate_loan(principal, taeg, duration_months, insurance_amount):
         "total_paid": total_paid,
         "cost_percentage": cost_percentage,
         "insurance_total_cost": insurance_total_cost,
-        "amortization_table": amortization_table
+        "amortization_schedule": amortization_schedule
     }
 
-def create_amortization_table(principal, monthly_rate, monthly_payment, duration_months, insurance_amount):
-    """Creates an amortization table for the loan."""
-    data = []
-    remaining_balance = principal
-    for month in range(1, duration_months + 1):
-        capital_beginning = remaining_balance
-        interest_payment = remaining_balance * monthly_rate
-        principal_payment = monthly_payment - interest_payment
-        remaining_balance -= principal_payment
-        if remaining_balance < 0:
-            remaining_balance = 0
-        total_payment = monthly_payment + insurance_amount
-        data.append([month, capital_beginning, principal_payment, interest_payment, insurance_amount, total_payment])
-
-    df = pd.DataFrame(data, columns=[get_translation("Mois"), get_translation("Capital Restant Du en Début de Période"), get_translation("Capital Amorti"), get_translation("Intérêts"), get_translation("Assurance"), get_translation("Total Echeance")])
-
-    # Calculate the totals BEFORE formatting (while still numeric)
-    total_capital_amorti = df[get_translation("Capital Amorti")].sum()
-    total_interest_paid = df[get_translation("Intérêts")].sum()
-    total_insurance = df[get_translation("Assurance")].sum()
-    total_echeance = df[get_translation("Total Echeance")].sum()
-
-    # NOW format with commas for display
-    df[get_translation("Capital Restant Du en Début de Période")] = df[get_translation("Capital Restant Du en Début de Période")].map(lambda x: f"{x:,.2f}")
-    df[get_translation("Capital Amorti")] = df[get_translation("Capital Amorti")].map(lambda x: f"{x:,.2f}")
-    df[get_translation("Intérêts")] = df[get_translation("Intérêts")].map(lambda x: f"{x:,.2f}")
-    df[get_translation("Assurance")] = df[get_translation("Assurance")].map(lambda x: f"{x:,.2f}")
-    df[get_translation("Total Echeance")] = df[get_translation("Total Echeance")].map(lambda x: f"{x:,.2f}")
-
-    # Add the total row with already formatted numbers
-    total_row = pd.DataFrame({
-        get_translation("Mois"): [get_translation("Total")], 
-        get_translation("Capital Restant Du en Début de Période"): [""], 
-        get_translation("Capital Amorti"): [f"{total_capital_amorti:,.2f}"], 
-        get_translation("Intérêts"): [f"{total_interest_paid:,.2f}"], 
-        get_translation("Assurance"): [f"{total_insurance:,.2f}"], 
-        get_translation("Total Echeance"): [f"{total_echeance:,.2f}"]
-    })
-    df = pd.concat([df, total_row], ignore_index=True)
+# Translation keys used by the amortization table (column headers and total row label)
+AMORTIZATION_COLUMNS = (
+    "Mois",
+    "Capital Restant Du en Début de Période",
+    "Capital Amorti",
+    "Intérêts",
+    "Assurance",
+    "Total Echeance",
+    "Total",
+)
+
+def _amortize(principal, monthly_rate, monthly_payment, duration_months, out):
+    """Fills a (duration_months, 3) array with the starting balance, principal and interest per month."""
+    elapsed = np.arange(duration_months, dtype=np.float64)
+
+    # Closed form of the balance recurrence: the balance at the start of month n
+    # is principal * (1 + r)^(n-1) - payment * ((1 + r)^(n-1) - 1) / r
+    if monthly_rate == 0:
+        balance = principal - monthly_payment * elapsed
+    else:
+        annuity_balance = monthly_payment / monthly_rate
+        balance = (principal - annuity_balance) * (1 + monthly_rate) ** elapsed + annuity_balance
+    # Rounding can leave the last balance slightly below zero; clamp without branching
+    np.maximum(balance, 0.0, out=out[:, 0])
+    np.multiply(out[:, 0], monthly_rate, out=out[:, 2])
+    np.subtract(monthly_payment, out[:, 2], out=out[:, 1])
+    return out
+
+@st.cache_data(max_entries=128)
+def compute_amortization_schedule(principal, monthly_rate, monthly_payment, duration_months, insurance_amount):
+    """Computes the numeric amortization schedule as NumPy arrays.
+
+    Kept free of translations so the cached result is shared across languages.
+    """
+    # One contiguous buffer for the whole schedule, columns: month, starting balance,
+    # principal, interest, insurance, total payment
+    table = np.empty((duration_months, 6), dtype=np.float64)
+    table[:, 0] = np.arange(1, duration_months + 1)
+    _amortize(principal, monthly_rate, monthly_payment, duration_months, out=table[:, 1:4])
+    table[:, 4] = insurance_amount
+    # The payment with insurance is the same every month
+    table[:, 5] = monthly_payment + insurance_amount
+
+    # Totals row: one reduction over the four adjacent amount columns, before any
+    # DataFrame exists
+    amount_keys = ("principal_payment", "interest_payment", "insurance", "total_payment")
+    amount_totals = table[:, 2:].sum(axis=0)
+
+    return {
+        "months": table[:, 0].astype(np.int64),
+        "capital_beginning": table[:, 1],
+        "principal_payment": table[:, 2],
+        "interest_payment": table[:, 3],
+        "insurance": table[:, 4],
+        "total_payment": table[:, 5],
+        "totals": dict(zip(amount_keys, amount_totals.tolist())),
+    }
+
+def create_amortization_table(schedule):
+    """Creates the amortization table for a schedule, labelled in the selected language."""
+    months = schedule["months"]
+    duration_months = len(months)
+    capital_beginning = schedule["capital_beginning"]
+    principal_payment = schedule["principal_payment"]
+    interest_payment = schedule["interest_payment"]
+    insurance = schedule["insurance"]
+    total_payment = schedule["total_payment"]
+    totals = schedule["totals"]
+
+    columns = {key: get_translation(key) for key in AMORTIZATION_COLUMNS}
+
+    # Append the total row, writing into arrays sized for the whole table so the
+    # DataFrame is allocated once. Amounts stay float64 and are formatted at render
+    # time; the total row is keyed by a "Total" label in the month index.
+    def with_total(values, total):
+        column = np.empty(duration_months + 1, dtype=np.float64)
+        column[:-1] = values
+        column[-1] = total
+        return column
+
+    month_index = np.empty(duration_months + 1, dtype=object)
+    month_index[:-1] = months
+    month_index[-1] = columns["Total"]
+
+    df = pd.DataFrame({
+        columns["Capital Restant Du en Début de Période"]: with_total(capital_beginning, np.nan),
+        columns["Capital Amorti"]: with_total(principal_payment, totals["principal_payment"]),
+        columns["Intérêts"]: with_total(interest_payment, totals["interest_payment"]),
+        columns["Assurance"]: with_total(insurance, totals["insurance"]),
+        columns["Total Echeance"]: with_total(total_payment, totals["total_payment"]),
+    }, index=pd.Index(month_index, name=columns["Mois"]))
 
     return df
 
@@ -121,52 +181,53 @@ def update_duration_years():
         st.session_state.duration_years = int(round(st.session_state.duration_months / 12))
 
 def highlight_total_row(df):
-    """Highlights the total row in grey."""
-    def highlight(row):
-        is_total_row = row.name == len(df) - 1
-        if is_total_row:
-            return ['background-color: #f0f0f0'] * len(row)
-        return [''] * len(row)
-    return df.style.apply(highlight, axis=1)
-
-# Translations dictionary
-translations = {
-    "Calculateur de Prêt 💸": {"Français": "Calculateur de Prêt 💸", "English": "Loan Calculator 💸"},
-    "Calculez facilement les détails de votre prêt.": {"Français": "Calculez facilement les détails de votre prêt.", "English": "Easily calculate the details of your loan."},
-    "Paramètres du Prêt": {"Français": "Paramètres du Prêt", "English": "Loan Parameters"},
-    "Montant du Prêt (€)": {"Français": "Montant du Prêt (€)", "English": "Loan Amount (€)"},
-    "TAEG (%)": {"Français": "TAEG (%)", "English": "APR (%)"},
-    "Durée (mois)": {"Français": "Durée (mois)", "English": "Duration (months)"},
-    "Assurance": {"Français": "Assurance", "English": "Insurance"},
-    "Montant Assurance par mois (€)": {"Français": "Montant Assurance par mois (€)", "English": "Monthly Insurance Amount (€)"},
-    "Calculer": {"Français": "Calculer", "English": "Calculate"},
-    "Mensualité": {"Français": "Mensualité", "English": "Monthly Payment"},
-    "Coût Total": {"Français": "Coût Total", "English": "Total Cost"},
-    "Total Remboursé": {"Français": "Total Remboursé", "English": "Total Paid"},
-    "Coût en % du Prêt": {"Français": "Coût en % du Prêt", "English": "Cost as % of Loan"},
-    "Coût Assurance Total": {"Français": "Coût Assurance Total", "English": "Total Insurance Cost"},
-    "Afficher le tableau d'amortissement": {"Français": "Afficher le tableau d'amortissement", "English": "Show Amortization Table"},
-    "Mois": {"Français": "Mois", "English": "Month"},
-    "Capital Restant Du en Début de Période": {"Français": "Capital Restant Du en Début de Période", "English": "Remaining Principal at Start of Period"},
-    "Capital Amorti": {"Français": "Capital Amorti", "English": "Principal Paid"},
-    "Intérêts": {"Français": "Intérêts", "English": "Interest"},
-    "Assurance": {"Français": "Assurance", "English": "Insurance"},
-    "Total Echeance": {"Français": "Total Echeance", "English": "Total Due"},
-    "Total": {"Français": "Total", "English": "Total"},
-    "Les valeurs doivent être positives.": {"Français": "Les valeurs doivent être positives.", "English": "Values must be positive."},
-    "Ajustez les valeurs et cliquez sur 'Calculer' pour voir les détails de votre prêt. 💸": {"Français": "Ajustez les valeurs et cliquez sur 'Calculer' pour voir les détails de votre prêt. 💸", "English": "Adjust the values and click 'Calculate' to see the details of your loan. 💸"},
-    "Assurance (%)": {"Français": "Assurance (%)", "English": "Insurance (%)"},  # THIS IS THE NEW LINE
-    "Durée (années)": {"Français": "Durée (années)", "English": "Duration (years)"},  # THIS IS THE NEW LINE
-}
+    """Highlights the total row in grey and formats the amounts with commas."""
+    fmt_map = {col: "{:,.2f}" for col in df.columns}
+
+    def highlight(data):
+        # Build the whole style matrix at once instead of calling back per row
+        styles = np.full(data.shape, '', dtype=object)
+        styles[-1:, :] = 'background-color: #f0f0f0'
+        return pd.DataFrame(styles, index=data.index, columns=data.columns)
+    return df.style.apply(highlight, axis=None).format(fmt_map, na_rep="")
+
+@st.fragment
+def loan_results(principal, taeg, duration_months, insurance_amount):
+    """Renders the calculate button, loan details and amortization table.
+
+    Runs as a fragment so clicking its buttons only reruns this block.
+    """
+    # Calculate Button
+    if st.button(get_translation("Calculer")):
+        try:
+            st.session_state.loan_data = calculate_loan(principal, taeg, duration_months, insurance_amount)
+        except ValueError as e:
+            st.error(f"Erreur : {e}")
+        except Exception as e:
+            st.error(f"Une erreur inattendue s'est produite : {e}")
+
+    # Display the loan data if exists
+    if "loan_data" in st.session_state and st.session_state.loan_data:
+        display_loan_details(st.session_state.loan_data)
+
+    # Toggle Amortization Table Button
+    if st.button(get_translation("Afficher le tableau d'amortissement")):
+        st.session_state.show_amortization_table = not st.session_state.show_amortization_table
+
+    # Display the amortization table if the button has been clicked and if the table exists
+    if st.session_state.show_amortization_table:
+        if st.session_state.loan_data:
+            amortization_table = create_amortization_table(st.session_state.loan_data["amortization_schedule"])
+            styled_table = highlight_total_row(amortization_table)
+            st.dataframe(styled_table)
 
 def get_translation(text_key):
     """Returns the translation for the given text key in the selected language."""
-    selected_language = st.session_state.language
-    return translations[text_key][selected_language]
+    return translate(text_key, st.session_state.language)
 
 # Streamlit Interface
 # Initialize session_state (This must be done BEFORE creating any widgets!)
-st.session_state.setdefault("language", "Français")
+st.session_state.setdefault("language", LANGUAGES[0])
 st.session_state.setdefault("insurance_amount", 0.0)
 st.session_state.setdefault("insurance_percentage", 0.0)
 st.session_state.setdefault("principal", 30000.0)
@@ -174,11 +235,10 @@ st.session_state.setdefault("taeg", 4.45)
 st.session_state.setdefault("duration_months", 57)
 st.session_state.setdefault("duration_years", 57/12)  # Add this line to initialize years
 st.session_state.setdefault("show_amortization_table", False)
-st.session_state.setdefault("amortization_table", pd.DataFrame())
 st.session_state.setdefault("loan_data", {})
 
 st.sidebar.header("Language")
-language = st.sidebar.selectbox("Select a language", ["Français", "English"], key="language")
+language = st.sidebar.selectbox("Select a language", LANGUAGES, key="language")
 
 st.title(get_translation("Calculateur de Prêt 💸"))
 st.write(get_translation("Calculez facilement les détails de votre prêt."))
@@ -236,29 +296,8 @@ insurance_percentage = st.sidebar.number_input(
     key="insurance_percentage",
 )
 
-# Calculate Button
-if st.button(get_translation("Calculer")):
-    try:
-        st.session_state.loan_data = calculate_loan(principal, taeg, duration_months, insurance_amount)
-        st.session_state.amortization_table = st.session_state.loan_data["amortization_table"]
-    except ValueError as e:
-        st.error(f"Erreur : {e}")
-    except Exception as e:
-        st.error(f"Une erreur inattendue s'est produite : {e}")
-
-# Display the loan data if exists
-if "loan_data" in st.session_state and st.session_state.loan_data:
-    display_loan_details(st.session_state.loan_data)
-
-# Toggle Amortization Table Button
-if st.button(get_translation("Afficher le tableau d'amortissement")):
-    st.session_state.show_amortization_table = not st.session_state.show_amortization_table
-
-# Display the amortization table if the button has been clicked and if the table exists
-if st.session_state.show_amortization_table:
-    if "amortization_table" in st.session_state:
-        styled_table = highlight_total_row(st.session_state.amortization_table)
-        st.dataframe(styled_table)
+# Calculation and results, rerun on their own when their buttons are clicked
+loan_results(principal, taeg, duration_months, insurance_amount)
 
 st.write(get_translation("Ajustez les valeurs et cliquez sur 'Calculer' pour voir les détails de votre prêt. 💸"))
 
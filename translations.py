@@ -0,0 +1,49 @@
+"""Translations for the loan calculator UI.
+
+Kept out of loan_app.py because Streamlit re-executes the main script on every
+rerun; an imported module is loaded once, so the tables below are built once
+and the lookup cache persists across reruns.
+"""
+import functools
+
+# Languages offered in the UI; every entry of the translations dictionary has one text per language
+LANGUAGES = ("Français", "English")
+
+# Translations dictionary
+translations = {
+    "Calculateur de Prêt 💸": {"Français": "Calculateur de Prêt 💸", "English": "Loan Calculator 💸"},
+    "Calculez facilement les détails de votre prêt.": {"Français": "Calculez facilement les détails de votre prêt.", "English": "Easily calculate the details of your loan."},
+    "Paramètres du Prêt": {"Français": "Paramètres du Prêt", "English": "Loan Parameters"},
+    "Montant du Prêt (€)": {"Français": "Montant du Prêt (€)", "English": "Loan Amount (€)"},
+    "TAEG (%)": {"Français": "TAEG (%)", "English": "APR (%)"},
+    "Durée (mois)": {"Français": "Durée (mois)", "English": "Duration (months)"},
+    "Assurance": {"Français": "Assurance", "English": "Insurance"},
+    "Montant Assurance par mois (€)": {"Français": "Montant Assurance par mois (€)", "English": "Monthly Insurance Amount (€)"},
+    "Calculer": {"Français": "Calculer", "English": "Calculate"},
+    "Mensualité": {"Français": "Mensualité", "English": "Monthly Payment"},
+    "Coût Total": {"Français": "Coût Total", "English": "Total Cost"},
+    "Total Remboursé": {"Français": "Total Remboursé", "English": "Total Paid"},
+    "Coût en % du Prêt": {"Français": "Coût en % du Prêt", "English": "Cost as % of Loan"},
+    "Coût Assurance Total": {"Français": "Coût Assurance Total", "English": "Total Insurance Cost"},
+    "Afficher le tableau d'amortissement": {"Français": "Afficher le tableau d'amortissement", "English": "Show Amortization Table"},
+    "Mois": {"Français": "Mois", "English": "Month"},
+    "Capital Restant Du en Début de Période": {"Français": "Capital Restant Du en Début de Période", "English": "Remaining Principal at Start of Period"},
+    "Capital Amorti": {"Français": "Capital Amorti", "English": "Principal Paid"},
+    "Intérêts": {"Français": "Intérêts", "English": "Interest"},
+    "Assurance": {"Français": "Assurance", "English": "Insurance"},
+    "Total Echeance": {"Français": "Total Echeance", "English": "Total Due"},
+    "Total": {"Français": "Total", "English": "Total"},
+    "Les valeurs doivent être positives.": {"Français": "Les valeurs doivent être positives.", "English": "Values must be positive."},
+    "Ajustez les valeurs et cliquez sur 'Calculer' pour voir les détails de votre prêt. 💸": {"Français": "Ajustez les valeurs et cliquez sur 'Calculer' pour voir les détails de votre prêt. 💸", "English": "Adjust the values and click 'Calculate' to see the details of your loan. 💸"},
+    "Assurance (%)": {"Français": "Assurance (%)", "English": "Insurance (%)"},  # THIS IS THE NEW LINE
+    "Durée (années)": {"Français": "Durée (années)", "English": "Duration (years)"},  # THIS IS THE NEW LINE
+}
+
+# Same translations indexed by language first, so a lookup is a single probe into
+# the table of the active language
+LANG_TABLES = {lang: {key: texts[lang] for key, texts in translations.items()} for lang in LANGUAGES}
+
+@functools.lru_cache(maxsize=None)
+def translate(text_key, language):
+    """Returns the cached translation for the given text key and language."""
+    return LANG_TABLES[language][text_key]